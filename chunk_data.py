@@ -18,9 +18,12 @@ def chunk_data():
 
     print(f"📊 Loading data from {input_file}...")
 
-    # Load the main dataset
+    # Load the main dataset (low-cardinality columns as category for cheaper masks)
     try:
-        df = pd.read_csv(input_file)
+        df = pd.read_csv(
+            input_file,
+            dtype={"primary_vehicle": "category", "primary_country": "category"},
+        )
         print(f"✅ Loaded {len(df):,} total records")
     except FileNotFoundError:
         print(f"❌ Error: {input_file} not found!")
@@ -47,43 +50,53 @@ def chunk_data():
 
     print(f"\n🎯 Chunking data by vehicle model...")
 
-    # Create chunks for target vehicles
-    target_data = []
+    # Group by vehicle in a single pass instead of one mask per target. The
+    # GroupBy stays lazy: only the target vehicles are materialized below,
+    # not a copy of every vehicle group
+    vehicle_groups = df.groupby("primary_vehicle", sort=False, observed=True)
+
+    # Create chunks for target vehicles, appending each one to a combined
+    # target vehicles file as it is written, so only one vehicle's rows
+    # are materialized at a time
+    target_file = output_dir / "target_vehicles_combined.csv"
+    combined_rows = 0
     for vehicle in target_vehicles:
-        vehicle_df = df[df["primary_vehicle"] == vehicle].copy()
-        if len(vehicle_df) > 0:
+        if vehicle in vehicle_groups.groups:
+            vehicle_df = vehicle_groups.get_group(vehicle)
             # Clean filename
             filename = vehicle.replace(" ", "_").replace(".", "").replace("/", "_")
             output_file = output_dir / f"{filename}.csv"
 
             # Save chunk
             vehicle_df.to_csv(output_file, index=False)
-            target_data.append(vehicle_df)
+            vehicle_df.to_csv(
+                target_file,
+                mode="a" if combined_rows else "w",
+                header=not combined_rows,
+                index=False,
+            )
+            combined_rows += len(vehicle_df)
 
             print(f"  ✅ {vehicle}: {len(vehicle_df):,} ads → {output_file}")
         else:
             print(f"  ⚠️  {vehicle}: No ads found")
 
-    # Create a combined target vehicles file
-    if target_data:
-        combined_target = pd.concat(target_data, ignore_index=True)
-        target_file = output_dir / "target_vehicles_combined.csv"
-        combined_target.to_csv(target_file, index=False)
-        print(
-            f"\n🎯 Combined target vehicles: {len(combined_target):,} ads → {target_file}"
-        )
+    if combined_rows:
+        print(f"\n🎯 Combined target vehicles: {combined_rows:,} ads → {target_file}")
 
-    # Create chunks for other vehicles (group smaller ones together)
-    other_vehicles = df[~df["primary_vehicle"].isin(target_vehicles)].copy()
-    if len(other_vehicles) > 0:
+    # Create chunks for other vehicles (group smaller ones together). Only
+    # their country column is selected, and each country's rows are
+    # copied out of df as that chunk is written
+    other_countries = df.loc[
+        ~df["primary_vehicle"].isin(target_vehicles), "primary_country"
+    ]
+    if len(other_countries) > 0:
         # Group by country to create manageable chunks
-        countries = other_vehicles["primary_country"].unique()
-
         print(f"\n🌍 Chunking other vehicles by country...")
-        for country in countries:
-            country_df = other_vehicles[
-                other_vehicles["primary_country"] == country
-            ].copy()
+        for country, country_rows in other_countries.groupby(
+            other_countries, sort=False, observed=True
+        ):
+            country_df = df.loc[country_rows.index]
             if len(country_df) > 0:
                 filename = f"other_vehicles_{country.replace(' ', '_')}.csv"
                 output_file = output_dir / filename
@@ -95,10 +108,10 @@ def chunk_data():
     # Create a metadata file
     metadata = {
         "total_records": len(df),
-        "target_vehicles": len(combined_target) if target_data else 0,
-        "other_vehicles": len(other_vehicles),
+        "target_vehicles": combined_rows,
+        "other_vehicles": len(other_countries),
         "countries": df["primary_country"].unique().tolist(),
-        "vehicle_models": df["primary_vehicle"].value_counts().to_dict(),
+        "vehicle_models": vehicles.to_dict(),
         "chunk_files": [f.name for f in output_dir.glob("*.csv")],
     }
 
@@ -115,8 +128,8 @@ def chunk_data():
     print(f"📁 Output directory: {output_dir}")
     print(f"📊 Total files created: {len(list(output_dir.glob('*.csv')))}")
     print(
-        f"💾 Target vehicle ads: {len(combined_target):,}"
-        if target_data
+        f"💾 Target vehicle ads: {combined_rows:,}"
+        if combined_rows
         else "💾 No target vehicle data found"
     )
 
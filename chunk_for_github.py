@@ -7,6 +7,7 @@ GitHub has a 100MB file size limit, so we split large files into smaller chunks.
 import pandas as pd
 import os
 import json
+from collections import Counter
 from pathlib import Path
 
 def chunk_for_github():
@@ -30,70 +31,76 @@ def chunk_for_github():
     file_size_mb = os.path.getsize(input_file) / (1024 * 1024)
     print(f"📁 Original file size: {file_size_mb:.1f} MB")
     
-    # Load the dataset
-    print("📖 Loading dataset...")
-    df = pd.read_csv(input_file)
-    print(f"✅ Loaded {len(df):,} total records")
-    
     # GitHub limit is 100MB, let's target 80MB chunks for safety
     target_chunk_size_mb = 80
     
+    # Light pass over just the summary columns for row count and metadata
+    # (ad text can contain newlines, so a raw line count would be wrong)
+    print("📖 Scanning dataset...")
+    columns = pd.read_csv(input_file, nrows=0).columns.tolist()
+    total_records = 0
+    vehicle_counts = Counter()
+    country_counts = Counter()
+    for batch in pd.read_csv(input_file, usecols=['primary_vehicle', 'primary_country'],
+                             dtype=str, chunksize=100_000):
+        total_records += len(batch)
+        vehicle_counts.update(batch['primary_vehicle'].value_counts().to_dict())
+        country_counts.update(batch['primary_country'].value_counts().to_dict())
+    print(f"✅ Found {total_records:,} total records")
+    
     if file_size_mb <= target_chunk_size_mb:
         print(f"✅ File is under {target_chunk_size_mb}MB, copying to Data/ directory")
-        output_file = output_dir / "ev_ads_data.csv"
-        df.to_csv(output_file, index=False)
-        chunk_size_mb = os.path.getsize(output_file) / (1024 * 1024)
-        print(f"📄 Copied to: {output_file} ({chunk_size_mb:.1f}MB)")
-        
-        # Create simple index
-        index_data = {
-            'total_records': len(df),
-            'total_size_mb': chunk_size_mb,
-            'chunk_files': ['ev_ads_data.csv'],
-            'num_chunks': 1
-        }
+        num_chunks = 1
     else:
         print(f"📦 File is {file_size_mb:.1f}MB, splitting into chunks...")
         
         # Calculate number of chunks needed
         num_chunks = int(file_size_mb / target_chunk_size_mb) + 1
-        rows_per_chunk = len(df) // num_chunks
-        
+    
+    rows_per_chunk = max(total_records // num_chunks, 1)
+    if num_chunks > 1:
         print(f"🔢 Creating {num_chunks} chunks with ~{rows_per_chunk:,} rows each")
-        
-        chunk_files = []
-        
-        # Create chunks
-        for i in range(num_chunks):
-            start_idx = i * rows_per_chunk
-            if i == num_chunks - 1:  # Last chunk gets remaining rows
-                end_idx = len(df)
+    
+    # Stream one chunk at a time so memory stays bounded by the chunk size.
+    # Reading every column as text writes values back exactly as in the source.
+    chunk_files = []
+    chunk_rows = []
+    reader = pd.read_csv(input_file, dtype=str, chunksize=rows_per_chunk)
+    for i, chunk_df in enumerate(reader):
+        if i < num_chunks:
+            if num_chunks == 1:
+                chunk_file = output_dir / "ev_ads_data.csv"
             else:
-                end_idx = (i + 1) * rows_per_chunk
-            
-            chunk_df = df.iloc[start_idx:end_idx].copy()
-            chunk_file = output_dir / f"ev_ads_data_chunk_{i+1:02d}.csv"
+                chunk_file = output_dir / f"ev_ads_data_chunk_{i+1:02d}.csv"
             chunk_df.to_csv(chunk_file, index=False)
-            chunk_files.append(chunk_file.name)
-            
-            # Check chunk size
-            chunk_size_mb = os.path.getsize(chunk_file) / (1024 * 1024)
-            print(f"  ✅ Chunk {i+1}: {len(chunk_df):,} rows, "
+            chunk_files.append(chunk_file)
+            chunk_rows.append(len(chunk_df))
+        else:  # Last chunk gets remaining rows
+            chunk_df.to_csv(chunk_files[-1], mode='a', header=False, index=False)
+            chunk_rows[-1] += len(chunk_df)
+    
+    for i, (chunk_file, rows) in enumerate(zip(chunk_files, chunk_rows)):
+        # Check chunk size
+        chunk_size_mb = os.path.getsize(chunk_file) / (1024 * 1024)
+        if num_chunks == 1:
+            print(f"📄 Copied to: {chunk_file} ({chunk_size_mb:.1f}MB)")
+        else:
+            print(f"  ✅ Chunk {i+1}: {rows:,} rows, "
                   f"{chunk_size_mb:.1f}MB → {chunk_file.name}")
-        
-        # Create index data
-        index_data = {
-            'total_records': len(df),
-            'total_size_mb': file_size_mb,
-            'chunk_files': chunk_files,
-            'num_chunks': num_chunks
-        }
+    
+    # Create index data
+    index_data = {
+        'total_records': total_records,
+        'total_size_mb': chunk_size_mb if num_chunks == 1 else file_size_mb,
+        'chunk_files': [chunk_file.name for chunk_file in chunk_files],
+        'num_chunks': num_chunks
+    }
     
     # Add metadata
     index_data.update({
-        'columns': df.columns.tolist(),
-        'sample_vehicles': df['primary_vehicle'].value_counts().head(10).to_dict(),
-        'sample_countries': df['primary_country'].value_counts().head(10).to_dict()
+        'columns': columns,
+        'sample_vehicles': dict(vehicle_counts.most_common(10)),
+        'sample_countries': dict(country_counts.most_common(10))
     })
     
     # Save index file
@@ -109,16 +116,16 @@ def chunk_for_github():
     print(f"📊 Total chunks: {index_data['num_chunks']}")
     print(f"💾 Total records: {index_data['total_records']:,}")
     
+    # Stat every CSV once; reused for disk usage and the size check
+    csv_sizes = [(f.name, f.stat().st_size / (1024 * 1024))
+                 for f in output_dir.iterdir() if f.suffix == ".csv"]
+    
     # Show disk usage
-    total_size = sum(f.stat().st_size for f in output_dir.glob("*.csv"))
-    print(f"💿 Total size: {total_size / (1024*1024):.1f} MB")
+    total_size_mb = sum(size_mb for _, size_mb in csv_sizes)
+    print(f"💿 Total size: {total_size_mb:.1f} MB")
     
     # GitHub compatibility check
-    oversized_files = []
-    for csv_file in output_dir.glob("*.csv"):
-        size_mb = csv_file.stat().st_size / (1024 * 1024)
-        if size_mb > 100:
-            oversized_files.append((csv_file.name, size_mb))
+    oversized_files = [(name, size_mb) for name, size_mb in csv_sizes if size_mb > 100]
     
     if oversized_files:
         print(f"\n⚠️  WARNING: {len(oversized_files)} files exceed 100MB GitHub limit:")
@@ -14,6 +14,7 @@ import os
 import hashlib
 import requests
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from io import BytesIO
 from pathlib import Path
@@ -57,63 +58,133 @@ st.markdown(
 )
 
 
-@st.cache_data
-def parse_openai_features(features_json):
-    """Parse OpenAI features JSON string"""
-    if pd.isna(features_json) or features_json == "":
-        return {}
-    try:
-        return json.loads(features_json)
-    except:
-        return {}
+# Columns the dashboard reads. The "source" field of each OpenAI feature names
+# the ad text column it came from, so those text columns are kept as well.
+DASHBOARD_COLUMNS = {
+    "ad_id",
+    "primary_vehicle",
+    "primary_country",
+    "advertiser_name",
+    "has_gender_targeting",
+    "primary_gender_target",
+    "image_url",
+    "gpt4_text_analysis",
+    "openai_features",
+    "ad_title",
+    "ad_description",
+    "extracted_text",
+    "analysis_themes",
+}
+
+
+# Low-cardinality columns that are filtered and grouped on; stored as
+# categoricals so comparisons and groupbys work on integer codes
+CATEGORY_COLUMNS = [
+    "primary_vehicle",
+    "primary_country",
+    "primary_gender_target",
+]
+
+
+# Full export, used when the chunked Data/ directory is not available
+ORIGINAL_DATA_FILE = "ev_ads_complete_with_images_and_gender_20250720_100525.csv"
+
+
+def read_dashboard_csv(path):
+    """Read a data CSV, parsing only the columns the dashboard uses"""
+    return pd.read_csv(
+        path,
+        usecols=lambda col: col in DASHBOARD_COLUMNS,
+        dtype={col: "category" for col in CATEGORY_COLUMNS},
+    )
 
 
-@st.cache_data
-def load_enhanced_data():
-    """Load the complete dataset from chunked CSV files in Data/ directory"""
-    try:
-        data_dir = Path("Data")
-
-        # First try to load from chunked data
-        if data_dir.exists():
-            # Load the combined target vehicles file if it exists
-            combined_file = data_dir / "target_vehicles_combined.csv"
-            if combined_file.exists():
-                df = pd.read_csv(combined_file)
+def count_categories(series):
+    """Value counts of a categorical column, without the categories that
+    filtering left without any rows. Only the counted Series is touched, so
+    the filtered frame is not copied again."""
+    return series.cat.remove_unused_categories().value_counts()
+
+
+def get_data_version():
+    """Names and modification times of the data files, passed to the cached
+    loaders so their results are refreshed whenever the data changes"""
+    data_files = sorted(Path("Data").glob("*.csv"))
+    original_file = Path(ORIGINAL_DATA_FILE)
+    if original_file.exists():
+        data_files.append(original_file)
+    return tuple((f.name, f.stat().st_mtime_ns) for f in data_files)
+
+
+# Persisted entries are never evicted from ~/.streamlit/cache; run
+# `streamlit cache clear` after regenerating Data/ to drop old versions
+@st.cache_data(persist="disk")
+def load_enhanced_data(data_version):
+    """Load the complete dataset from chunked CSV files in Data/ directory.
+    Raises instead of returning a placeholder, so a failed load is never
+    cached (or persisted to disk)"""
+    data_dir = Path("Data")
+
+    # First try to load from chunked data
+    if data_dir.exists():
+        # Load the combined target vehicles file if it exists
+        combined_file = data_dir / "target_vehicles_combined.csv"
+        if combined_file.exists():
+            df = read_dashboard_csv(combined_file)
+            return df
+
+        # Otherwise, load and combine individual chunks
+        csv_files = list(data_dir.glob("*.csv"))
+        csv_files = [f for f in csv_files if f.name != "metadata.json"]
+
+        if csv_files:
+            chunk_files = [
+                csv_file
+                for csv_file in csv_files
+                if csv_file.name != "target_vehicles_combined.csv"
+            ]
+            # Chunk reads are independent, so overlap them on a thread pool
+            # (map keeps the results in file order)
+            with ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1)
+            ) as executor:
+                dataframes = list(executor.map(read_dashboard_csv, chunk_files))
+
+            if dataframes:
+                df = pd.concat(dataframes, ignore_index=True)
+                # Chunks have different category sets, so concat falls back
+                # to object columns; restore the categoricals
+                df = df.astype(
+                    {col: "category" for col in CATEGORY_COLUMNS if col in df}
+                )
                 return df
 
-            # Otherwise, load and combine individual chunks
-            csv_files = list(data_dir.glob("*.csv"))
-            csv_files = [f for f in csv_files if f.name != "metadata.json"]
-
-            if csv_files:
-                dataframes = []
-                for csv_file in csv_files:
-                    if csv_file.name not in [
-                        "metadata.json",
-                        "target_vehicles_combined.csv",
-                    ]:
-                        chunk_df = pd.read_csv(csv_file)
-                        dataframes.append(chunk_df)
-
-                if dataframes:
-                    df = pd.concat(dataframes, ignore_index=True)
-                    return df
-
-        # Fallback to original file if chunked data not available
-        original_file = "ev_ads_complete_with_images_and_gender_20250720_100525.csv"
-        if os.path.exists(original_file):
-            df = pd.read_csv(original_file)
-            return df
+    # Fallback to original file if chunked data not available
+    original_file = ORIGINAL_DATA_FILE
+    if os.path.exists(original_file):
+        df = read_dashboard_csv(original_file)
+        return df
 
-        st.error(
-            "❌ No data files found. Please ensure Data/ directory contains CSV files or the original dataset exists."
-        )
-        return None
+    raise FileNotFoundError(
+        "No data files found. Please ensure Data/ directory contains CSV files or the original dataset exists."
+    )
 
-    except Exception as e:
-        st.error(f"❌ Error loading data: {e}")
-        return None
+
+@st.cache_data
+def get_filter_options(data_version):
+    """Sorted sidebar filter options, computed once per data load rather than
+    on every rerun"""
+    df = load_enhanced_data(data_version)
+    return {
+        col: ["All"] + sorted(df[col].unique().tolist())
+        for col in [
+            "primary_vehicle",
+            "primary_country",
+            "advertiser_name",
+            "primary_gender_target",
+        ]
+        if col in df.columns
+    }
 
 
 def parse_openai_features(features_json):
@@ -126,57 +197,73 @@ def parse_openai_features(features_json):
         return {}
 
 
-def find_local_image_exact(ad_id, image_url):
-    """Find locally saved image for an ad using exact hash matching"""
-    # Generate the same filename used in download scripts
-    url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
-    filename = f"{ad_id}_{url_hash}.jpg"
+# Local directories searched for downloaded ad images, in priority order
+LOCAL_IMAGE_DIRS = [
+    "ev_ad_images/by_car_model",
+    "ev_ad_images/thumbnails",
+    "sample_images",
+    "downloaded_images/originals",
+]
 
-    # Check possible local directories
-    local_dirs = [
-        "ev_ad_images/by_car_model",
-        "ev_ad_images/thumbnails",
-        "sample_images",
-        "downloaded_images/originals",
-    ]
 
-    for base_dir in local_dirs:
+def get_image_dirs_version():
+    """Modification times of the local image directories and of the folders
+    directly inside them (images are saved one level down, e.g. by car model),
+    passed to the cached index so it picks up images added while the app runs"""
+    dir_mtimes = []
+    for base_dir in LOCAL_IMAGE_DIRS:
+        if os.path.exists(base_dir):
+            dir_mtimes.append((base_dir, os.stat(base_dir).st_mtime_ns))
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dir_mtimes.append((entry.path, entry.stat().st_mtime_ns))
+    return tuple(sorted(dir_mtimes))
+
+
+@st.cache_resource(max_entries=1)
+def index_local_images(image_dirs_version):
+    """Walk the local image directories once per image_dirs_version, indexing
+    image paths by filename and by ad_id, so lookups don't re-walk the tree
+    for every ad"""
+    paths_by_filename = {}
+    paths_by_ad_id = {}
+
+    for base_dir in LOCAL_IMAGE_DIRS:
         if os.path.exists(base_dir):
-            # Search in subdirectories
             for root, dirs, files in os.walk(base_dir):
-                if filename in files:
-                    return os.path.join(root, filename)
+                for file in files:
+                    path = os.path.join(root, file)
+                    # Keep the first match in search order, as a direct scan would
+                    paths_by_filename.setdefault(file, path)
 
-            # Also check direct filename match
-            direct_path = os.path.join(base_dir, filename)
-            if os.path.exists(direct_path):
-                return direct_path
+                    # Downloaded images are named "{ad_id}_{url_hash}.jpg", and
+                    # ad_ids can contain "_" themselves (e.g. "google_13")
+                    if "_" in file and file.lower().endswith((".jpg", ".jpeg", ".png")):
+                        paths_by_ad_id.setdefault(file.rsplit("_", 1)[0], path)
 
-    return None
+    return paths_by_filename, paths_by_ad_id
+
+
+def get_local_image_index():
+    """Index of the local images as they are on disk now"""
+    return index_local_images(get_image_dirs_version())
+
+
+def find_local_image_exact(ad_id, image_url):
+    """Find locally saved image for an ad using exact hash matching"""
+    # Generate the same filename used in download scripts
+    url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
+    filename = f"{ad_id}_{url_hash}.jpg"
+
+    paths_by_filename, _ = get_local_image_index()
+    return paths_by_filename.get(filename)
 
 
 def find_local_image_by_ad_id(ad_id):
     """Find locally saved image for an ad by ad_id only (ignoring hash)"""
-    # Check possible local directories
-    local_dirs = [
-        "ev_ad_images/by_car_model",
-        "ev_ad_images/thumbnails",
-        "sample_images",
-        "downloaded_images/originals",
-    ]
-
-    for base_dir in local_dirs:
-        if os.path.exists(base_dir):
-            # Search in subdirectories
-            for root, dirs, files in os.walk(base_dir):
-                for file in files:
-                    # Check if filename starts with ad_id followed by underscore
-                    if file.startswith(f"{ad_id}_") and file.lower().endswith(
-                        (".jpg", ".jpeg", ".png")
-                    ):
-                        return os.path.join(root, file)
-
-    return None
+    _, paths_by_ad_id = get_local_image_index()
+    return paths_by_ad_id.get(str(ad_id))
 
 
 def find_local_image(ad_id, image_url):
@@ -228,8 +315,9 @@ def load_image_local_or_url(ad_id, image_url, prefer_local=True):
     return None, "failed"
 
 
-def display_ad_image(row, prefer_local=True, max_width=300):
-    """Display an ad image using local file first, fallback to URL"""
+def display_ad_image(row, prefer_local=True, max_width=300, loaded_image=None):
+    """Display an ad image using local file first, fallback to URL.
+    Pass loaded_image as an (image, source) pair if it was already loaded."""
 
     ad_id = row.get("ad_id", "Unknown")
     image_url = row.get("image_url")
@@ -239,8 +327,11 @@ def display_ad_image(row, prefer_local=True, max_width=300):
     # Create a cleaner container for the image and info
     with st.container():
         if pd.notna(image_url):
-            # Try to load image (local first, then URL)
-            image, source = load_image_local_or_url(ad_id, image_url, prefer_local)
+            # Try to load image (local first, then URL) unless already loaded
+            if loaded_image is not None:
+                image, source = loaded_image
+            else:
+                image, source = load_image_local_or_url(ad_id, image_url, prefer_local)
 
             if image:
                 source_emoji = "💾" if source == "local" else "🌐"
@@ -326,9 +417,11 @@ def create_image_gallery_with_preference(
 
     # If prioritize_local_display is True, prioritize records with local images
     if prioritize_local_display:
-        # Check which records have local images
-        df_with_images["has_local_image"] = df_with_images.apply(
-            lambda row: find_local_image_by_ad_id(str(row["ad_id"])) is not None, axis=1
+        # Check which records have local images, fetching the index once for
+        # all ads
+        _, paths_by_ad_id = get_local_image_index()
+        df_with_images["has_local_image"] = (
+            df_with_images["ad_id"].astype(str).map(paths_by_ad_id).notna()
         )
 
         # Sort by has_local_image (True first), then by index
@@ -345,22 +438,27 @@ def create_image_gallery_with_preference(
     # Limit number of images to display
     df_display = df_with_images.head(max_images)
 
-    # Count local vs URL images
+    # Count local vs URL images. Each image is loaded once here and handed to
+    # the gallery below rather than being read or downloaded a second time.
     local_count = 0
     url_count = 0
     failed_count = 0
+    loaded_images = []
 
     for idx, row in df_display.iterrows():
         ad_id = row.get("ad_id", "Unknown")
         image_url = row.get("image_url")
         if pd.notna(image_url):
             image, source = load_image_local_or_url(ad_id, image_url, prefer_local)
+            loaded_images.append((image, source))
             if source == "local":
                 local_count += 1
             elif source == "url":
                 url_count += 1
             else:
                 failed_count += 1
+        else:
+            loaded_images.append(None)
 
     # Display statistics in a clean format
     col1, col2, col3, col4 = st.columns(4)
@@ -394,9 +492,332 @@ def create_image_gallery_with_preference(
                             row,
                             prefer_local=prefer_local,
                             max_width=350,
+                            loaded_image=loaded_images[i + j],
                         )
 
 
+@st.fragment
+def render_image_gallery_tab(filtered_df):
+    """Image gallery tab. Runs as a fragment, so its own filters and display
+    options only rerun this tab instead of the whole dashboard."""
+    st.header("🖼️ Image Gallery")
+
+    # Show image URL statistics
+    total_with_images = filtered_df["image_url"].notna().sum()
+    st.info(f"📸 {total_with_images} ads have image URLs in current selection")
+
+    # Add filtering controls for image gallery
+    col_img1, col_img2, col_img3, col_img4 = st.columns(4)
+
+    with col_img1:
+        # Vehicle filter for images
+        img_vehicle_filter = st.selectbox(
+            "Filter by vehicle:",
+            ["All"] + sorted(filtered_df["primary_vehicle"].unique().tolist()),
+            key="img_vehicle_filter",
+        )
+
+    with col_img2:
+        # Country filter for images
+        img_country_filter = st.selectbox(
+            "Filter by country:",
+            ["All"] + sorted(filtered_df["primary_country"].unique().tolist()),
+            key="img_country_filter",
+        )
+
+    with col_img3:
+        # Number of images to show
+        img_count = st.selectbox(
+            "Images to show:", [6, 12, 24, 48], index=1, key="img_count"
+        )
+
+    with col_img4:
+        # Image source preference
+        prefer_local = st.checkbox(
+            "Prefer local images",
+            value=True,
+            help="Try local files first, fallback to URLs",
+        )
+
+        # Prioritize local images in display order
+        prioritize_local = st.checkbox(
+            "Show local images first",
+            value=True,
+            help="Display ads with local images at the top",
+        )
+
+    # Apply filters to get image data, limited to ads with image URLs
+    img_mask = filtered_df["image_url"].notna()
+
+    if img_vehicle_filter != "All":
+        img_mask &= filtered_df["primary_vehicle"] == img_vehicle_filter
+
+    if img_country_filter != "All":
+        img_mask &= filtered_df["primary_country"] == img_country_filter
+
+    img_filtered_df = filtered_df[img_mask]
+
+    # Display the image gallery using the new function
+    if len(img_filtered_df) > 0:
+        st.markdown(
+            f"**📊 Showing up to {img_count} ads from {len(img_filtered_df)} available**"
+        )
+
+        # Use the new image gallery function with local preference
+        # Pass the full filtered dataset - the function will handle sampling and sorting
+        create_image_gallery_with_preference(
+            img_filtered_df,
+            title="🖼️ Advertisement Images",
+            max_images=img_count,
+            prefer_local=prefer_local,
+            prioritize_local_display=prioritize_local,
+        )
+
+        # Show GPT-4 analysis summary if available
+        ads_with_analysis = img_filtered_df[
+            img_filtered_df["gpt4_text_analysis"].notna()
+        ]
+        if len(ads_with_analysis) > 0:
+            st.subheader("🤖 GPT-4 Image Analysis Insights")
+
+            # Show a few sample analyses
+            for i, (idx, row) in enumerate(ads_with_analysis.head(3).iterrows()):
+                with st.expander(
+                    f"Analysis {i+1}: {row['primary_vehicle']} - {row['advertiser_name']}"
+                ):
+                    col1, col2 = st.columns([1, 2])
+                    with col1:
+                        if pd.notna(row["image_url"]):
+                            st.image(row["image_url"], width=200)
+                    with col2:
+                        st.text(str(row["gpt4_text_analysis"])[:800] + "...")
+    else:
+        st.warning("No ads found for the current filters.")
+
+
+@st.fragment
+def render_feature_breakdown(
+    features_with_source_df, selected_vehicle, selected_country
+):
+    """Detailed feature breakdown. Runs as a fragment, so changing its vehicle
+    and country filters only reruns this section instead of the whole
+    dashboard."""
+    # Add filtering controls for detailed breakdown
+    st.subheader("🔍 Filter Features")
+    col_filter1, col_filter2 = st.columns(2)
+
+    # Build each sorted option list once and reuse it for the index
+    breakdown_vehicles = ["All"] + sorted(
+        features_with_source_df["vehicle"].unique().tolist()
+    )
+    breakdown_countries = ["All"] + sorted(
+        features_with_source_df["country"].unique().tolist()
+    )
+
+    with col_filter1:
+        # Vehicle filter (sync with sidebar)
+        breakdown_vehicle_filter = st.selectbox(
+            "Filter by vehicle:",
+            breakdown_vehicles,
+            key="breakdown_vehicle_filter",
+            index=(
+                breakdown_vehicles.index(selected_vehicle)
+                if selected_vehicle in breakdown_vehicles
+                else 0
+            ),
+        )
+
+    with col_filter2:
+        # Country filter (sync with sidebar)
+        breakdown_country_filter = st.selectbox(
+            "Filter by country:",
+            breakdown_countries,
+            key="breakdown_country_filter",
+            index=(
+                breakdown_countries.index(selected_country)
+                if selected_country in breakdown_countries
+                else 0
+            ),
+        )
+
+    # Apply filters to feature data as one combined mask
+    feature_mask = pd.Series(True, index=features_with_source_df.index)
+    if breakdown_vehicle_filter != "All":
+        feature_mask &= features_with_source_df["vehicle"] == breakdown_vehicle_filter
+    if breakdown_country_filter != "All":
+        feature_mask &= features_with_source_df["country"] == breakdown_country_filter
+    filtered_features_df = features_with_source_df[feature_mask]
+
+    # Recalculate feature summary with filtered data
+    if len(filtered_features_df) > 0:
+        filtered_feature_summary = (
+            filtered_features_df.groupby(["category", "claim"])
+            .agg(
+                {
+                    "vehicle": lambda x: list(x.unique()),
+                    "country": lambda x: list(x.unique()),
+                    "positioning": lambda x: list(x.unique()),
+                    "tone": lambda x: list(x.unique()),
+                    "source": lambda x: list(x.unique()),
+                    "source_text": lambda x: list(x.unique()),
+                    "actual_source_content": lambda x: list(x.unique()),
+                    "advertiser": lambda x: list(x.unique()),
+                    "ad_id": lambda x: list(x.unique()),
+                }
+            )
+            .reset_index()
+        )
+
+        # Add ad count for filtered features
+        filtered_feature_summary["ad_count"] = (
+            filtered_features_df.groupby(["category", "claim"]).size().values
+        )
+
+        # Sort by ad count
+        filtered_feature_summary = filtered_feature_summary.sort_values(
+            "ad_count", ascending=False
+        )
+
+        # Filter out generic claims
+        filtered_feature_summary = filtered_feature_summary[
+            (filtered_feature_summary["category"] != "error")
+            & (filtered_feature_summary["claim"].str.len() > 5)
+            & (
+                ~filtered_feature_summary["claim"].str.contains(
+                    "unknown|error|n/a", case=False, na=False
+                )
+            )
+        ]
+
+        # Display features grouped by category
+        categories = filtered_feature_summary["category"].unique()
+
+        for category in categories:
+            if category and category != "error":
+                category_features = filtered_feature_summary[
+                    filtered_feature_summary["category"] == category
+                ]
+                total_ads_in_category = category_features["ad_count"].sum()
+
+                with st.expander(
+                    f"🔧 {category.title()} ",
+                    expanded=False,
+                ):
+                    st.caption(
+                        f"📊 {len(category_features)} total ad mentions in this category"
+                    )
+                    for idx, row in category_features.iterrows():
+                        claim = row["claim"]
+                        ad_count = row["ad_count"]
+                        vehicles = ", ".join(
+                            [v for v in row["vehicle"] if v and v != "unknown"]
+                        )
+                        countries = ", ".join(
+                            [c for c in row["country"] if c and c != "unknown"]
+                        )
+                        positioning = ", ".join(
+                            [p for p in row["positioning"] if p and p != "unknown"]
+                        )
+                        tone = ", ".join(
+                            [t for t in row["tone"] if t and t != "unknown"]
+                        )
+                        source = ", ".join(
+                            [s for s in row["source"] if s and s != "unknown"]
+                        )
+
+                        # Get source texts and advertisers
+                        source_field_names = row.get("source_text", [])
+                        actual_contents = row.get("actual_source_content", [])
+                        advertisers = row.get("advertiser", [])
+                        ad_ids = row.get("ad_id", [])
+
+                        # Make each feature collapsible
+                        feature_title = f"{claim[:60]}..." if len(claim) > 60 else claim
+                        with st.expander(
+                            f"📋 {feature_title} ",
+                            expanded=False,
+                        ):
+                            # Show all details together as one
+                            # markdown block instead of an element
+                            # per field
+                            detail_lines = [f"**Claim:** {claim}"]
+                            if source:
+                                detail_lines.append(f"**Source:** {source}")
+                            if countries:
+                                detail_lines.append(f"**Countries:** {countries}")
+                            if vehicles:
+                                detail_lines.append(f"**Vehicles:** {vehicles}")
+                            if positioning:
+                                detail_lines.append(f"**Positioning:** {positioning}")
+                            if tone:
+                                detail_lines.append(f"**Tone:** {tone}")
+                            st.write("\n\n".join(detail_lines))
+
+                            # Show just one source text example
+                            if actual_contents and any(
+                                content.strip() for content in actual_contents
+                            ):
+                                # Find the first non-empty source content
+                                for i, (
+                                    content,
+                                    advertiser,
+                                    ad_id,
+                                ) in enumerate(
+                                    zip(
+                                        actual_contents,
+                                        advertisers,
+                                        ad_ids,
+                                    )
+                                ):
+                                    if content.strip():
+                                        # Get the source field name
+                                        source_field = (
+                                            source_field_names[i]
+                                            if i < len(source_field_names)
+                                            else "unknown"
+                                        )
+
+                                        st.write(
+                                            f"**Source Text:** (from {source_field})"
+                                        )
+                                        st.text_area(
+                                            "Source content",
+                                            content,
+                                            height=150,
+                                            key=f"source_{category}_{idx}",
+                                            label_visibility="collapsed",
+                                        )
+                                        break  # Only show the first one
+                    else:
+                        st.warning("No features found with current filters")
+
+
+# Common brand names and model names, compiled once into a single pattern
+BRAND_NAME_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(brand)
+        for brand in [
+            "volkswagen",
+            "vw",
+            "tesla",
+            "audi",
+            "bmw",
+            "hyundai",
+            "ioniq",
+            "id.4",
+            "id4",
+            "model y",
+            "q4 e-tron",
+            "ix1",
+            "ix3",
+        ]
+    )
+    + r")\b",
+    flags=re.IGNORECASE,
+)
+
+
 def clean_brand_names(text, vehicle_name):
     """Remove brand names and model names from text"""
     if pd.isna(text):
@@ -406,30 +827,11 @@ def clean_brand_names(text, vehicle_name):
     text = str(text).lower()
 
     # Remove common brand names and model names
-    brands_to_remove = [
-        "volkswagen",
-        "vw",
-        "tesla",
-        "audi",
-        "bmw",
-        "hyundai",
-        "ioniq",
-        "id.4",
-        "id4",
-        "model y",
-        "q4 e-tron",
-        "ix1",
-        "ix3",
-    ]
-
-    for brand in brands_to_remove:
-        text = re.sub(rf"\b{re.escape(brand)}\b", "", text, flags=re.IGNORECASE)
-
-    # Remove extra whitespace
-    cleaned_text = re.sub(r"\s+", " ", text).strip()
-
-    # Remove very short words (less than 3 characters)
-    words = cleaned_text.split()
+    text = BRAND_NAME_PATTERN.sub("", text)
+
+    # Remove very short words (less than 3 characters); split() also
+    # collapses extra whitespace
+    words = text.split()
     words = [word for word in words if len(word) >= 3]
     cleaned_text = " ".join(words)
 
@@ -447,52 +849,240 @@ def clean_brand_names(text, vehicle_name):
     return cleaned_text
 
 
+# Automotive jargon and technical terms to highlight in ad titles
+AUTOMOTIVE_JARGON = {
+    # Performance terms
+    "horsepower",
+    "hp",
+    "torque",
+    "acceleration",
+    "0-60",
+    "mph",
+    "kph",
+    "performance",
+    "sport",
+    "turbo",
+    "supercharged",
+    # EV specific terms
+    "electric",
+    "battery",
+    "charging",
+    "range",
+    "kwh",
+    "kw",
+    "fast",
+    "rapid",
+    "supercharging",
+    "dc",
+    "ac",
+    "volt",
+    "voltage",
+    "regenerative",
+    "regen",
+    "efficiency",
+    "mpge",
+    "miles",
+    "kilometers",
+    "charge",
+    "plug",
+    "outlet",
+    "station",
+    # Technology terms
+    "autopilot",
+    "autonomous",
+    "self-driving",
+    "adaptive",
+    "cruise",
+    "control",
+    "lane",
+    "assist",
+    "parking",
+    "sensors",
+    "camera",
+    "radar",
+    "lidar",
+    "navigation",
+    "gps",
+    "infotainment",
+    "touchscreen",
+    "display",
+    "connectivity",
+    "bluetooth",
+    "wifi",
+    "wireless",
+    "smartphone",
+    "app",
+    "over-the-air",
+    "ota",
+    "update",
+    "software",
+    # Safety terms
+    "airbag",
+    "airbags",
+    "safety",
+    "crash",
+    "test",
+    "rating",
+    "stars",
+    "iihs",
+    "nhtsa",
+    "collision",
+    "avoidance",
+    "emergency",
+    "braking",
+    "abs",
+    "stability",
+    "traction",
+    "control",
+    "blind",
+    "spot",
+    "monitoring",
+    # Comfort/luxury terms
+    "leather",
+    "heated",
+    "cooled",
+    "ventilated",
+    "seats",
+    "massage",
+    "memory",
+    "premium",
+    "luxury",
+    "comfort",
+    "climate",
+    "dual-zone",
+    "tri-zone",
+    "panoramic",
+    "sunroof",
+    "moonroof",
+    "ambient",
+    "lighting",
+    # Design terms
+    "aerodynamic",
+    "sleek",
+    "sporty",
+    "elegant",
+    "sophisticated",
+    "modern",
+    "futuristic",
+    "design",
+    "styling",
+    "exterior",
+    "interior",
+    "dashboard",
+    "cockpit",
+    "cabin",
+    "spacious",
+    "roomy",
+    "cargo",
+    "trunk",
+    "storage",
+    # Drivetrain terms
+    "awd",
+    "4wd",
+    "fwd",
+    "rwd",
+    "all-wheel",
+    "four-wheel",
+    "front-wheel",
+    "rear-wheel",
+    "drive",
+    "drivetrain",
+    "transmission",
+    "automatic",
+    "manual",
+    "cvt",
+    "dual-clutch",
+    "gearbox",
+    # Efficiency terms
+    "eco",
+    "green",
+    "sustainable",
+    "zero",
+    "emissions",
+    "clean",
+    "renewable",
+    "energy",
+    "efficient",
+    "economy",
+    # Warranty/service terms
+    "warranty",
+    "maintenance",
+    "service",
+    "certified",
+    "pre-owned",
+    "inspection",
+    "guarantee",
+    "coverage",
+    # Financing terms
+    "lease",
+    "financing",
+    "apr",
+    "down",
+    "payment",
+    "monthly",
+    "special",
+    "offer",
+    "deal",
+    "discount",
+    "rebate",
+    "incentive",
+}
+
+
 def main():
     # Clean interface - no header needed
 
     # Load data
-    df = load_enhanced_data()
-    if df is None:
+    data_version = get_data_version()
+    try:
+        df = load_enhanced_data(data_version)
+    except FileNotFoundError as e:
+        st.error(f"❌ {e}")
+        return
+    except Exception as e:
+        st.error(f"❌ Error loading data: {e}")
         return
 
     # Sidebar filters
     st.sidebar.header("🔍 Filters")
+    filter_options = get_filter_options(data_version)
 
     # Vehicle filter
-    vehicles = ["All"] + sorted(df["primary_vehicle"].unique().tolist())
+    vehicles = filter_options["primary_vehicle"]
     selected_vehicle = st.sidebar.selectbox("Select Vehicle", vehicles)
 
     # Country filter
-    countries = ["All"] + sorted(df["primary_country"].unique().tolist())
+    countries = filter_options["primary_country"]
     selected_country = st.sidebar.selectbox("Select Country", countries)
 
     # Advertiser type filter
-    advertiser_types = ["All"] + sorted(df["advertiser_name"].unique().tolist())
+    advertiser_types = filter_options["advertiser_name"]
     selected_advertiser = st.sidebar.selectbox("Select Advertiser", advertiser_types)
 
     # Gender targeting filter (if available)
     if "primary_gender_target" in df.columns:
-        gender_targets = ["All"] + sorted(df["primary_gender_target"].unique().tolist())
+        gender_targets = filter_options["primary_gender_target"]
         selected_gender = st.sidebar.selectbox("Gender Targeting", gender_targets)
     else:
         selected_gender = "All"
 
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters: combine them into one mask and select rows once, rather
+    # than materializing an intermediate frame per filter
+    mask = pd.Series(True, index=df.index)
 
     if selected_vehicle != "All":
-        filtered_df = filtered_df[filtered_df["primary_vehicle"] == selected_vehicle]
+        mask &= df["primary_vehicle"] == selected_vehicle
 
     if selected_country != "All":
-        filtered_df = filtered_df[filtered_df["primary_country"] == selected_country]
+        mask &= df["primary_country"] == selected_country
 
     if selected_advertiser != "All":
-        filtered_df = filtered_df[filtered_df["advertiser_name"] == selected_advertiser]
+        mask &= df["advertiser_name"] == selected_advertiser
 
     if selected_gender != "All" and "primary_gender_target" in df.columns:
-        filtered_df = filtered_df[
-            filtered_df["primary_gender_target"] == selected_gender
-        ]
+        mask &= df["primary_gender_target"] == selected_gender
+
+    filtered_df = df[mask]
 
     # Main dashboard
     col1, col2, col3, col4 = st.columns(4)
@@ -550,7 +1140,7 @@ def main():
 
         with col1:
             # Vehicle distribution
-            vehicle_counts = filtered_df["primary_vehicle"].value_counts()
+            vehicle_counts = count_categories(filtered_df["primary_vehicle"])
             fig_vehicles = px.bar(
                 x=vehicle_counts.values,
                 y=vehicle_counts.index,
@@ -562,7 +1152,7 @@ def main():
 
         with col2:
             # Country distribution
-            country_counts = filtered_df["primary_country"].value_counts()
+            country_counts = count_categories(filtered_df["primary_country"])
             fig_countries = px.pie(
                 values=country_counts.values,
                 names=country_counts.index,
@@ -593,13 +1183,17 @@ def main():
             gender_data = filtered_df[filtered_df["has_gender_targeting"] == True]
 
             if len(gender_data) > 0:
+                # Gender targeting distribution (also reused for the insights below)
+                gender_dist = count_categories(gender_data["primary_gender_target"])
+
                 col1, col2 = st.columns(2)
 
                 with col1:
                     # Gender targeting by vehicle
                     gender_vehicle = (
                         gender_data.groupby(
-                            ["primary_vehicle", "primary_gender_target"]
+                            ["primary_vehicle", "primary_gender_target"],
+                            observed=True,
                         )
                         .size()
                         .unstack(fill_value=0)
@@ -612,8 +1206,6 @@ def main():
                     st.plotly_chart(fig_gender_vehicle, use_container_width=True)
 
                 with col2:
-                    # Gender targeting distribution
-                    gender_dist = gender_data["primary_gender_target"].value_counts()
                     fig_gender_dist = px.pie(
                         values=gender_dist.values,
                         names=gender_dist.index,
@@ -623,33 +1215,26 @@ def main():
 
                 # Gender targeting insights
                 st.markdown('<div class="insight-box">', unsafe_allow_html=True)
-                st.write("**🔍 Gender Targeting Insights:**")
 
-                male_dominant = gender_data[
-                    gender_data["primary_gender_target"] == "Male"
-                ]
-                female_dominant = gender_data[
-                    gender_data["primary_gender_target"] == "Female"
-                ]
-                mixed_targeting = gender_data[
-                    gender_data["primary_gender_target"] == "Mixed"
-                ]
+                male_count = gender_dist.get("Male", 0)
+                female_count = gender_dist.get("Female", 0)
+                mixed_count = gender_dist.get("Mixed", 0)
 
-                st.write(
-                    f"• **Male-targeted ads**: {len(male_dominant)} ({len(male_dominant)/len(gender_data)*100:.1f}%)"
-                )
-                st.write(
-                    f"• **Female-targeted ads**: {len(female_dominant)} ({len(female_dominant)/len(gender_data)*100:.1f}%)"
-                )
-                st.write(
-                    f"• **Mixed targeting**: {len(mixed_targeting)} ({len(mixed_targeting)/len(gender_data)*100:.1f}%)"
-                )
+                # Collect the insight lines and render them as one element
+                insight_lines = [
+                    "**🔍 Gender Targeting Insights:**",
+                    f"• **Male-targeted ads**: {male_count} ({male_count/len(gender_data)*100:.1f}%)",
+                    f"• **Female-targeted ads**: {female_count} ({female_count/len(gender_data)*100:.1f}%)",
+                    f"• **Mixed targeting**: {mixed_count} ({mixed_count/len(gender_data)*100:.1f}%)",
+                ]
 
-                if len(male_dominant) > len(female_dominant):
-                    st.write(
+                if male_count > female_count:
+                    insight_lines.append(
                         "• **Opportunity**: Strong male bias suggests potential for female-targeted campaigns"
                     )
 
+                st.write("\n\n".join(insight_lines))
+
                 st.markdown("</div>", unsafe_allow_html=True)
             else:
                 st.warning("No gender targeting data available for current filters")
@@ -662,40 +1247,63 @@ def main():
         # Check if OpenAI features are available
         if "openai_features" in filtered_df.columns:
             st.subheader("OpenAI Feature Analysis")
-            # Parse OpenAI features
+            # Parse OpenAI features once and reuse them for every breakdown below.
+            # Rows without features are dropped once up front, so only real JSON
+            # gets decoded and the loops below never visit empty rows.
+            raw_features = filtered_df["openai_features"]
+            feature_rows = filtered_df[raw_features.notna() & (raw_features != "")]
+            parsed_features = feature_rows["openai_features"].map(parse_openai_features)
+
+            # One tuple per feature; columns are named when the frame is built
             feature_data = []
-            for idx, row in filtered_df.iterrows():
-                features = parse_openai_features(row["openai_features"])
+            # itertuples over just the needed columns avoids building a Series per row
+            for row, features in zip(
+                feature_rows[["primary_vehicle", "primary_country"]].itertuples(
+                    index=False
+                ),
+                parsed_features,
+            ):
                 for category, details in features.items():
                     # Handle case where details might be a string instead of dict
                     if isinstance(details, dict):
                         feature_data.append(
-                            {
-                                "vehicle": row["primary_vehicle"],
-                                "country": row["primary_country"],
-                                "category": category,
-                                "claim": details.get("claim", ""),
-                                "positioning": details.get("positioning", ""),
-                                "tone": details.get("tone", ""),
-                                "source": details.get("source", ""),
-                            }
+                            (
+                                row.primary_vehicle,
+                                row.primary_country,
+                                category,
+                                details.get("claim", ""),
+                                details.get("positioning", ""),
+                                details.get("tone", ""),
+                                details.get("source", ""),
+                            )
                         )
                     else:
                         # If details is a string, create a basic entry
                         feature_data.append(
-                            {
-                                "vehicle": row["primary_vehicle"],
-                                "country": row["primary_country"],
-                                "category": category,
-                                "claim": str(details),
-                                "positioning": "unknown",
-                                "tone": "unknown",
-                                "source": "unknown",
-                            }
+                            (
+                                row.primary_vehicle,
+                                row.primary_country,
+                                category,
+                                str(details),
+                                "unknown",
+                                "unknown",
+                                "unknown",
+                            )
                         )
 
             if feature_data:
-                features_df = pd.DataFrame(feature_data)
+                features_df = pd.DataFrame(
+                    feature_data,
+                    columns=[
+                        "vehicle",
+                        "country",
+                        "category",
+                        "claim",
+                        "positioning",
+                        "tone",
+                        "source",
+                    ],
+                )
 
                 col1, col2 = st.columns(2)
 
@@ -759,10 +1367,10 @@ def main():
                 )
 
                 # Rotate the heatmap 90 degrees by swapping x and y
+                # The transposed frame is passed directly; imshow takes the
+                # vehicle/category labels from its axes
                 fig_vehicle_features = px.imshow(
-                    vehicle_features.T.values,  # Transpose to rotate 90 degrees
-                    x=vehicle_features.index,  # Vehicles on x-axis
-                    y=vehicle_features.columns,  # Categories on y-axis
+                    vehicle_features.T,  # Transpose to rotate 90 degrees
                     title="Feature Mentions by Vehicle (Rotated View)",
                     color_continuous_scale="Blues",
                     aspect="auto",
@@ -785,35 +1393,35 @@ def main():
                 # First, let's get the source_text for each feature by merging back with original data
                 # Add ad_id to features_df to link back to original data
                 features_with_source = []
-                for idx, row in filtered_df.iterrows():
-                    if pd.notna(row["openai_features"]):
-                        features = parse_openai_features(row["openai_features"])
-                        for category, details in features.items():
-                            if isinstance(details, dict):
-                                # The structure is category -> details (not category -> claim_key -> details)
-                                features_with_source.append(
-                                    {
-                                        "ad_id": row["ad_id"],
-                                        "category": category,
-                                        "claim": details.get("claim", "Unknown claim"),
-                                        "vehicle": row["primary_vehicle"],
-                                        "country": row["primary_country"],
-                                        "positioning": details.get(
-                                            "positioning", "unknown"
-                                        ),
-                                        "tone": details.get("tone", "unknown"),
-                                        "source": details.get("source", "unknown"),
-                                        "source_text": details.get(
-                                            "source", "unknown"
-                                        ),  # Store the source field name
-                                        "actual_source_content": str(
-                                            row.get(details.get("source", ""), "") or ""
-                                        ),  # Get actual content from that field
-                                        "advertiser": row.get(
-                                            "advertiser_name", "Unknown"
-                                        ),
-                                    }
-                                )
+                # Plain dicts for the feature rows, rather than building a
+                # Series per row with iterrows
+                for row, features in zip(
+                    feature_rows.to_dict("records"), parsed_features
+                ):
+                    for category, details in features.items():
+                        if isinstance(details, dict):
+                            # The structure is category -> details (not category -> claim_key -> details)
+                            features_with_source.append(
+                                {
+                                    "ad_id": row["ad_id"],
+                                    "category": category,
+                                    "claim": details.get("claim", "Unknown claim"),
+                                    "vehicle": row["primary_vehicle"],
+                                    "country": row["primary_country"],
+                                    "positioning": details.get(
+                                        "positioning", "unknown"
+                                    ),
+                                    "tone": details.get("tone", "unknown"),
+                                    "source": details.get("source", "unknown"),
+                                    "source_text": details.get(
+                                        "source", "unknown"
+                                    ),  # Store the source field name
+                                    "actual_source_content": str(
+                                        row.get(details.get("source", ""), "") or ""
+                                    ),  # Get actual content from that field
+                                    "advertiser": row.get("advertiser_name", "Unknown"),
+                                }
+                            )
 
                 if features_with_source:
                     features_with_source_df = pd.DataFrame(features_with_source)
@@ -862,252 +1470,9 @@ def main():
                         )
                     ]
 
-                    # Add filtering controls for detailed breakdown
-                    st.subheader("🔍 Filter Features")
-                    col_filter1, col_filter2 = st.columns(2)
-
-                    with col_filter1:
-                        # Vehicle filter (sync with sidebar)
-                        breakdown_vehicle_filter = st.selectbox(
-                            "Filter by vehicle:",
-                            ["All"]
-                            + sorted(
-                                features_with_source_df["vehicle"].unique().tolist()
-                            ),
-                            key="breakdown_vehicle_filter",
-                            index=(
-                                0
-                                if selected_vehicle == "All"
-                                else (
-                                    (
-                                        ["All"]
-                                        + sorted(
-                                            features_with_source_df["vehicle"]
-                                            .unique()
-                                            .tolist()
-                                        )
-                                    ).index(selected_vehicle)
-                                    if selected_vehicle
-                                    in features_with_source_df["vehicle"].unique()
-                                    else 0
-                                )
-                            ),
-                        )
-
-                    with col_filter2:
-                        # Country filter (sync with sidebar)
-                        breakdown_country_filter = st.selectbox(
-                            "Filter by country:",
-                            ["All"]
-                            + sorted(
-                                features_with_source_df["country"].unique().tolist()
-                            ),
-                            key="breakdown_country_filter",
-                            index=(
-                                0
-                                if selected_country == "All"
-                                else (
-                                    (
-                                        ["All"]
-                                        + sorted(
-                                            features_with_source_df["country"]
-                                            .unique()
-                                            .tolist()
-                                        )
-                                    ).index(selected_country)
-                                    if selected_country
-                                    in features_with_source_df["country"].unique()
-                                    else 0
-                                )
-                            ),
-                        )
-
-                    # Apply filters to feature data
-                    filtered_features_df = features_with_source_df.copy()
-                    if breakdown_vehicle_filter != "All":
-                        filtered_features_df = filtered_features_df[
-                            filtered_features_df["vehicle"] == breakdown_vehicle_filter
-                        ]
-                    if breakdown_country_filter != "All":
-                        filtered_features_df = filtered_features_df[
-                            filtered_features_df["country"] == breakdown_country_filter
-                        ]
-
-                    # Recalculate feature summary with filtered data
-                    if len(filtered_features_df) > 0:
-                        filtered_feature_summary = (
-                            filtered_features_df.groupby(["category", "claim"])
-                            .agg(
-                                {
-                                    "vehicle": lambda x: list(x.unique()),
-                                    "country": lambda x: list(x.unique()),
-                                    "positioning": lambda x: list(x.unique()),
-                                    "tone": lambda x: list(x.unique()),
-                                    "source": lambda x: list(x.unique()),
-                                    "source_text": lambda x: list(x.unique()),
-                                    "actual_source_content": lambda x: list(x.unique()),
-                                    "advertiser": lambda x: list(x.unique()),
-                                    "ad_id": lambda x: list(x.unique()),
-                                }
-                            )
-                            .reset_index()
-                        )
-
-                        # Add ad count for filtered features
-                        filtered_feature_summary["ad_count"] = (
-                            filtered_features_df.groupby(["category", "claim"])
-                            .size()
-                            .values
-                        )
-
-                        # Sort by ad count
-                        filtered_feature_summary = filtered_feature_summary.sort_values(
-                            "ad_count", ascending=False
-                        )
-
-                        # Filter out generic claims
-                        filtered_feature_summary = filtered_feature_summary[
-                            (filtered_feature_summary["category"] != "error")
-                            & (filtered_feature_summary["claim"].str.len() > 5)
-                            & (
-                                ~filtered_feature_summary["claim"].str.contains(
-                                    "unknown|error|n/a", case=False, na=False
-                                )
-                            )
-                        ]
-
-                        # Display features grouped by category
-                        categories = filtered_feature_summary["category"].unique()
-
-                        for category in categories:
-                            if category and category != "error":
-                                category_features = filtered_feature_summary[
-                                    filtered_feature_summary["category"] == category
-                                ]
-                                total_ads_in_category = category_features[
-                                    "ad_count"
-                                ].sum()
-
-                                with st.expander(
-                                    f"🔧 {category.title()} ",
-                                    expanded=False,
-                                ):
-                                    st.caption(
-                                        f"📊 {len(category_features)} total ad mentions in this category"
-                                    )
-                                    for idx, row in category_features.iterrows():
-                                        claim = row["claim"]
-                                        ad_count = row["ad_count"]
-                                        vehicles = ", ".join(
-                                            [
-                                                v
-                                                for v in row["vehicle"]
-                                                if v and v != "unknown"
-                                            ]
-                                        )
-                                        countries = ", ".join(
-                                            [
-                                                c
-                                                for c in row["country"]
-                                                if c and c != "unknown"
-                                            ]
-                                        )
-                                        positioning = ", ".join(
-                                            [
-                                                p
-                                                for p in row["positioning"]
-                                                if p and p != "unknown"
-                                            ]
-                                        )
-                                        tone = ", ".join(
-                                            [
-                                                t
-                                                for t in row["tone"]
-                                                if t and t != "unknown"
-                                            ]
-                                        )
-                                        source = ", ".join(
-                                            [
-                                                s
-                                                for s in row["source"]
-                                                if s and s != "unknown"
-                                            ]
-                                        )
-
-                                        # Get source texts and advertisers
-                                        source_field_names = row.get("source_text", [])
-                                        actual_contents = row.get(
-                                            "actual_source_content", []
-                                        )
-                                        advertisers = row.get("advertiser", [])
-                                        ad_ids = row.get("ad_id", [])
-
-                                        # Make each feature collapsible
-                                        feature_title = (
-                                            f"{claim[:60]}..."
-                                            if len(claim) > 60
-                                            else claim
-                                        )
-                                        with st.expander(
-                                            f"📋 {feature_title} ",
-                                            expanded=False,
-                                        ):
-                                            # Show all details together
-                                            st.write(f"**Claim:** {claim}")
-                                            if source:
-                                                st.write(f"**Source:** {source}")
-                                            if countries:
-                                                st.write(f"**Countries:** {countries}")
-                                            if vehicles:
-                                                st.write(f"**Vehicles:** {vehicles}")
-                                            if positioning:
-                                                st.write(
-                                                    f"**Positioning:** {positioning}"
-                                                )
-                                            if tone:
-                                                st.write(f"**Tone:** {tone}")
-
-                                            # Show just one source text example
-                                            if actual_contents and any(
-                                                content.strip()
-                                                for content in actual_contents
-                                            ):
-                                                # Find the first non-empty source content
-                                                for i, (
-                                                    content,
-                                                    advertiser,
-                                                    ad_id,
-                                                ) in enumerate(
-                                                    zip(
-                                                        actual_contents,
-                                                        advertisers,
-                                                        ad_ids,
-                                                    )
-                                                ):
-                                                    if content.strip():
-                                                        # Get the source field name
-                                                        source_field = (
-                                                            source_field_names[i]
-                                                            if i
-                                                            < len(source_field_names)
-                                                            else "unknown"
-                                                        )
-
-                                                        st.write(
-                                                            f"**Source Text:** (from {source_field})"
-                                                        )
-                                                        st.text_area(
-                                                            "Source content",
-                                                            content,
-                                                            height=150,
-                                                            key=f"source_{category}_{idx}",
-                                                            label_visibility="collapsed",
-                                                        )
-                                                        break  # Only show the first one
-                                    else:
-                                        st.warning(
-                                            "No features found with current filters"
-                                        )
+                    render_feature_breakdown(
+                        features_with_source_df, selected_vehicle, selected_country
+                    )
                 else:
                     st.warning("No feature analysis data available for current filters")
         else:
@@ -1117,104 +1482,7 @@ def main():
             )
 
     with tab4:
-        st.header("🖼️ Image Gallery")
-
-        # Show image URL statistics
-        total_with_images = filtered_df["image_url"].notna().sum()
-        st.info(f"📸 {total_with_images} ads have image URLs in current selection")
-
-        # Add filtering controls for image gallery
-        col_img1, col_img2, col_img3, col_img4 = st.columns(4)
-
-        with col_img1:
-            # Vehicle filter for images
-            img_vehicle_filter = st.selectbox(
-                "Filter by vehicle:",
-                ["All"] + sorted(filtered_df["primary_vehicle"].unique().tolist()),
-                key="img_vehicle_filter",
-            )
-
-        with col_img2:
-            # Country filter for images
-            img_country_filter = st.selectbox(
-                "Filter by country:",
-                ["All"] + sorted(filtered_df["primary_country"].unique().tolist()),
-                key="img_country_filter",
-            )
-
-        with col_img3:
-            # Number of images to show
-            img_count = st.selectbox(
-                "Images to show:", [6, 12, 24, 48], index=1, key="img_count"
-            )
-
-        with col_img4:
-            # Image source preference
-            prefer_local = st.checkbox(
-                "Prefer local images",
-                value=True,
-                help="Try local files first, fallback to URLs",
-            )
-
-            # Prioritize local images in display order
-            prioritize_local = st.checkbox(
-                "Show local images first",
-                value=True,
-                help="Display ads with local images at the top",
-            )
-
-        # Apply filters to get image data
-        img_filtered_df = filtered_df.copy()
-
-        if img_vehicle_filter != "All":
-            img_filtered_df = img_filtered_df[
-                img_filtered_df["primary_vehicle"] == img_vehicle_filter
-            ]
-
-        if img_country_filter != "All":
-            img_filtered_df = img_filtered_df[
-                img_filtered_df["primary_country"] == img_country_filter
-            ]
-
-        # Filter to only ads with image URLs
-        img_filtered_df = img_filtered_df[img_filtered_df["image_url"].notna()]
-
-        # Display the image gallery using the new function
-        if len(img_filtered_df) > 0:
-            st.markdown(
-                f"**📊 Showing up to {img_count} ads from {len(img_filtered_df)} available**"
-            )
-
-            # Use the new image gallery function with local preference
-            # Pass the full filtered dataset - the function will handle sampling and sorting
-            create_image_gallery_with_preference(
-                img_filtered_df,
-                title="🖼️ Advertisement Images",
-                max_images=img_count,
-                prefer_local=prefer_local,
-                prioritize_local_display=prioritize_local,
-            )
-
-            # Show GPT-4 analysis summary if available
-            ads_with_analysis = img_filtered_df[
-                img_filtered_df["gpt4_text_analysis"].notna()
-            ]
-            if len(ads_with_analysis) > 0:
-                st.subheader("🤖 GPT-4 Image Analysis Insights")
-
-                # Show a few sample analyses
-                for i, (idx, row) in enumerate(ads_with_analysis.head(3).iterrows()):
-                    with st.expander(
-                        f"Analysis {i+1}: {row['primary_vehicle']} - {row['advertiser_name']}"
-                    ):
-                        col1, col2 = st.columns([1, 2])
-                        with col1:
-                            if pd.notna(row["image_url"]):
-                                st.image(row["image_url"], width=200)
-                        with col2:
-                            st.text(str(row["gpt4_text_analysis"])[:800] + "...")
-        else:
-            st.warning("No ads found for the current filters.")
+        render_image_gallery_tab(filtered_df)
 
     with tab5:
         st.header("📈 Advanced Analytics")
@@ -1231,199 +1499,18 @@ def main():
                 words = re.findall(r"\b\w+\b", all_text.lower())
                 word_freq = Counter(words)
 
-                # Define automotive jargon and technical terms to highlight
-                automotive_jargon = {
-                    # Performance terms
-                    "horsepower",
-                    "hp",
-                    "torque",
-                    "acceleration",
-                    "0-60",
-                    "mph",
-                    "kph",
-                    "performance",
-                    "sport",
-                    "turbo",
-                    "supercharged",
-                    # EV specific terms
-                    "electric",
-                    "battery",
-                    "charging",
-                    "range",
-                    "kwh",
-                    "kw",
-                    "fast",
-                    "rapid",
-                    "supercharging",
-                    "dc",
-                    "ac",
-                    "volt",
-                    "voltage",
-                    "regenerative",
-                    "regen",
-                    "efficiency",
-                    "mpge",
-                    "miles",
-                    "kilometers",
-                    "charge",
-                    "plug",
-                    "outlet",
-                    "station",
-                    # Technology terms
-                    "autopilot",
-                    "autonomous",
-                    "self-driving",
-                    "adaptive",
-                    "cruise",
-                    "control",
-                    "lane",
-                    "assist",
-                    "parking",
-                    "sensors",
-                    "camera",
-                    "radar",
-                    "lidar",
-                    "navigation",
-                    "gps",
-                    "infotainment",
-                    "touchscreen",
-                    "display",
-                    "connectivity",
-                    "bluetooth",
-                    "wifi",
-                    "wireless",
-                    "smartphone",
-                    "app",
-                    "over-the-air",
-                    "ota",
-                    "update",
-                    "software",
-                    # Safety terms
-                    "airbag",
-                    "airbags",
-                    "safety",
-                    "crash",
-                    "test",
-                    "rating",
-                    "stars",
-                    "iihs",
-                    "nhtsa",
-                    "collision",
-                    "avoidance",
-                    "emergency",
-                    "braking",
-                    "abs",
-                    "stability",
-                    "traction",
-                    "control",
-                    "blind",
-                    "spot",
-                    "monitoring",
-                    # Comfort/luxury terms
-                    "leather",
-                    "heated",
-                    "cooled",
-                    "ventilated",
-                    "seats",
-                    "massage",
-                    "memory",
-                    "premium",
-                    "luxury",
-                    "comfort",
-                    "climate",
-                    "dual-zone",
-                    "tri-zone",
-                    "panoramic",
-                    "sunroof",
-                    "moonroof",
-                    "ambient",
-                    "lighting",
-                    # Design terms
-                    "aerodynamic",
-                    "sleek",
-                    "sporty",
-                    "elegant",
-                    "sophisticated",
-                    "modern",
-                    "futuristic",
-                    "design",
-                    "styling",
-                    "exterior",
-                    "interior",
-                    "dashboard",
-                    "cockpit",
-                    "cabin",
-                    "spacious",
-                    "roomy",
-                    "cargo",
-                    "trunk",
-                    "storage",
-                    # Drivetrain terms
-                    "awd",
-                    "4wd",
-                    "fwd",
-                    "rwd",
-                    "all-wheel",
-                    "four-wheel",
-                    "front-wheel",
-                    "rear-wheel",
-                    "drive",
-                    "drivetrain",
-                    "transmission",
-                    "automatic",
-                    "manual",
-                    "cvt",
-                    "dual-clutch",
-                    "gearbox",
-                    # Efficiency terms
-                    "eco",
-                    "green",
-                    "sustainable",
-                    "zero",
-                    "emissions",
-                    "clean",
-                    "renewable",
-                    "energy",
-                    "efficient",
-                    "economy",
-                    # Warranty/service terms
-                    "warranty",
-                    "maintenance",
-                    "service",
-                    "certified",
-                    "pre-owned",
-                    "inspection",
-                    "guarantee",
-                    "coverage",
-                    # Financing terms
-                    "lease",
-                    "financing",
-                    "apr",
-                    "down",
-                    "payment",
-                    "monthly",
-                    "special",
-                    "offer",
-                    "deal",
-                    "discount",
-                    "rebate",
-                    "incentive",
-                }
-
                 # Filter for automotive jargon only
-                automotive_words = {
-                    word: count
-                    for word, count in word_freq.items()
-                    if word in automotive_jargon and count > 1
-                }
-
-                # Get top automotive terms
-                top_automotive_words = dict(
-                    sorted(automotive_words.items(), key=lambda x: x[1], reverse=True)[
-                        :20
-                    ]
+                automotive_words = Counter(
+                    {
+                        word: count
+                        for word, count in word_freq.items()
+                        if word in AUTOMOTIVE_JARGON and count > 1
+                    }
                 )
 
+                # Get top automotive terms (heap selection instead of a full sort)
+                top_automotive_words = dict(automotive_words.most_common(20))
+
                 if top_automotive_words:
                     fig_words = px.bar(
                         x=list(top_automotive_words.values()),